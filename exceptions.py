@@ -8,6 +8,14 @@ class ServerError(Exception):
     pass
 
 
+class RateLimitError(Exception):
+    """Исключение при превышении лимита запросов к серверу."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class CheckApiAnswerError(Exception):
     """Исключение при проверке данных."""
     pass
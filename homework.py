@@ -1,17 +1,29 @@
 import sys
 import os
+import json
 import logging
+import queue
+import random
 import requests
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 from telegram import Bot
+from telegram.utils.request import Request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from exceptions import (HTTPStatusError,
                         ServerError,
                         CheckApiAnswerError,
-                        ParseError)
+                        ParseError,
+                        RateLimitError)
 
 
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
@@ -19,8 +31,20 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_TIME = 600
+BACKOFF_BASE = 1
+BACKOFF_MAX = 30
+MESSAGE_MAX_LENGTH = 4000
+STATE_FILE = '.state.json'
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 30)
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    'https://',
+    requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+)
 
 
 HOMEWORK_STATUSES = {
@@ -29,31 +53,67 @@ HOMEWORK_STATUSES = {
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
 
+RECOVERABLE_ERRORS = (
+    ServerError,
+    HTTPStatusError,
+    requests.ConnectionError,
+    requests.Timeout
+)
+
 load_dotenv()
 
 
 def init_logger() -> logging.Logger:
-    """Инициализация логгера."""
+    """Инициализация логгера с выводом в отдельном потоке."""
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
     handler = logging.StreamHandler(sys.stdout)
-    logger.addHandler(handler)
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     handler.setFormatter(formatter)
+    log_queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, handler)
+    listener.start()
     return logger
 
 
 logger = init_logger()
 
 
+def load_timestamp() -> int:
+    """Загрузка последней обработанной метки времени с диска."""
+    try:
+        with open(STATE_FILE, encoding='utf-8') as state:
+            return int(json.load(state)['current_date'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return int(time.time())
+
+
+def save_timestamp(timestamp: int) -> None:
+    """Атомарное сохранение метки времени на диск."""
+    tmp_path = f'{STATE_FILE}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as state:
+        json.dump({'current_date': timestamp}, state)
+    os.replace(tmp_path, STATE_FILE)
+
+
+def decode_json(response: requests.Response) -> dict:
+    """Декодирование json из ответа сервера."""
+    content = getattr(response, 'content', None)
+    if orjson is not None and isinstance(content, bytes):
+        return orjson.loads(content)
+    return response.json()
+
+
 def send_message(bot: Bot, message: str) -> None:
     """Отправка сообщения об изменении статуса проверки."""
     try:
         bot.send_message(TELEGRAM_CHAT_ID, message)
-        logger.info(f'Бот отправил сообщение {message}')
+        logger.info('Бот отправил сообщение %s', message)
     except Exception as error:
         logger.error(
-            f'Сбой в работе программы: бот не смог отправить сообщение!{error}'
+            'Сбой в работе программы: бот не смог отправить сообщение!%s',
+            error
         )
 
 
@@ -62,32 +122,45 @@ def get_api_answer(current_timestamp: time) -> dict:
     timestamp = current_timestamp
     params = {'from_date': timestamp}
     try:
-        homework_statuses = requests.get(
+        homework_statuses = SESSION.get(
             ENDPOINT,
-            headers=HEADERS,
-            params=params
+            params=params,
+            timeout=REQUEST_TIMEOUT
         )
-        logger.info(f'Отправлен запрос {ENDPOINT}')
+        logger.info('Отправлен запрос %s', ENDPOINT)
     except Exception as error:
         logger.error(
-            f'Сбой! Сервер не доступен! {error}.'
+            'Сбой! Сервер не доступен! %s.', error
         )
         raise ServerError(
             f'Сбой! Сервер не доступен! {error}.'
         )
+    if homework_statuses.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        retry_after = homework_statuses.headers.get('Retry-After')
+        try:
+            retry_after = int(retry_after)
+        except (TypeError, ValueError):
+            retry_after = None
+        logger.error(
+            'Сбой! Превышен лимит запросов. Retry-After: %s.', retry_after
+        )
+        raise RateLimitError(
+            'Превышен лимит запросов к серверу',
+            retry_after=retry_after
+        )
     if homework_statuses.status_code != HTTPStatus.OK:
         logger.error(
-            f'Сбой! Код ответа: {homework_statuses.status_code}.!'
+            'Сбой! Код ответа: %s.!', homework_statuses.status_code
         )
         raise HTTPStatusError(
             f'Сбой! Код ответа: {homework_statuses.status_code}.!'
         )
     logger.info('Код ответа на запрос: HTTPStatus.OK')
     try:
-        return homework_statuses.json()
+        return decode_json(homework_statuses)
     except Exception as error:
         logger.error(
-            f'Сбой! Данные получены не в формате json! {error}.'
+            'Сбой! Данные получены не в формате json! %s.', error
         )
         raise ServerError(
             f'Сбой! Данные получены не в формате json! {error}.'
@@ -116,10 +189,12 @@ def check_response(response: dict) -> list:
             'Сбой в работе программы! Домашние работы пришли не в виде списка'
         )
         raise CheckApiAnswerError('Домашние работы пришли не в виде списка')
-    if len(response['homeworks']) == 0:
+    homeworks = response['homeworks']
+    if not homeworks:
         logger.debug('В ответе отсутствуют новые статусы')
+        return homeworks
     logger.info('Полученные от сервера данные корректны')
-    return response['homeworks']
+    return homeworks
 
 
 def parse_status(homework: dict) -> str:
@@ -136,17 +211,57 @@ def parse_status(homework: dict) -> str:
             'Сбой в работе программы. Домашней работе не присвоено название'
         )
         raise KeyError('Домашней работе не присвоено название')
-    try:
-        verdict = HOMEWORK_STATUSES[homework_status]
-        return f'Изменился статус проверки работы "{homework_name}". {verdict}'
-    except Exception as error:
+    verdict = HOMEWORK_STATUSES.get(homework_status)
+    if verdict is None:
         logger.error(
-            f'Сбой в работе программы. {error} '
-            'Домашней работе присвоен неизвестный статус'
+            'Сбой в работе программы. %s '
+            'Домашней работе присвоен неизвестный статус',
+            homework_status
         )
         raise KeyError(
-            f'Домашней работе присвоен неизвестный статус. {error}'
+            f'Домашней работе присвоен неизвестный статус {homework_status}'
         )
+    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+
+
+def backoff_delay(failures: int, retry_after: int = None) -> float:
+    """Расчёт задержки перед повторной попыткой с джиттером."""
+    if retry_after is not None:
+        return retry_after + random.uniform(0, 1)
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** failures)
+    return delay * (0.5 + random.random())
+
+
+def select_new_statuses(homeworks: list, last_sent: dict) -> list:
+    """Отбор сообщений по работам с изменившимся статусом."""
+    messages = []
+    for homework in homeworks:
+        message = parse_status(homework)
+        name = homework.get('homework_name')
+        status = homework.get('status')
+        if name in last_sent and last_sent[name] == status:
+            logger.debug('Статус работы "%s" не изменился', name)
+            continue
+        messages.append(message)
+        last_sent[name] = status
+    return messages
+
+
+def batch_messages(messages: list) -> list:
+    """Объединение сообщений в пакеты с учётом лимита Telegram."""
+    batches = []
+    current = ''
+    for message in messages:
+        if not current:
+            current = message
+        elif len(current) + len(message) + 2 > MESSAGE_MAX_LENGTH:
+            batches.append(current)
+            current = message
+        else:
+            current = f'{current}\n\n{message}'
+    if current:
+        batches.append(current)
+    return batches
 
 
 def check_tokens() -> bool:
@@ -162,22 +277,50 @@ def check_tokens() -> bool:
 
 def main() -> None:
     """Основная логика работы бота."""
-    bot = Bot(token=TELEGRAM_TOKEN)
-    current_timestamp = int(time.time())
-    check_tokens()
-    while True:
-        try:
-            response = get_api_answer(current_timestamp)
-            homeworks = check_response(response)
-            for homework in homeworks:
-                message = parse_status(homework)
+    if not check_tokens():
+        sys.exit(1)
+    bot = Bot(
+        token=TELEGRAM_TOKEN,
+        request=Request(con_pool_size=1, connect_timeout=5, read_timeout=30)
+    )
+    current_timestamp = load_timestamp()
+    failures = 0
+    last_sent = {}
+    deadline = time.monotonic()
+    with ThreadPoolExecutor(max_workers=1) as sender:
+        while True:
+            try:
+                response = get_api_answer(current_timestamp)
+                homeworks = check_response(response)
+                if homeworks:
+                    messages = select_new_statuses(homeworks, last_sent)
+                    for batch in batch_messages(messages):
+                        sender.submit(send_message, bot, batch)
+                current_timestamp = response['current_date']
+                save_timestamp(current_timestamp)
+                failures = 0
+                deadline = max(deadline + RETRY_TIME, time.monotonic())
+                time.sleep(max(0.0, deadline - time.monotonic()))
+            except RateLimitError as error:
+                failures += 1
+                delay = backoff_delay(failures, error.retry_after)
+                logger.info('Повторная попытка через %.1f с.', delay)
+                time.sleep(delay)
+                deadline = time.monotonic()
+            except RECOVERABLE_ERRORS as error:
+                failures += 1
+                if failures == 1:
+                    message = f'Сбой в работе программы: {error}'
+                    sender.submit(send_message, bot, message)
+                delay = backoff_delay(failures)
+                logger.info('Повторная попытка через %.1f с.', delay)
+                time.sleep(delay)
+                deadline = time.monotonic()
+            except Exception as error:
+                message = f'Критический сбой в работе программы: {error}'
+                logger.critical(message)
                 send_message(bot, message)
-            current_timestamp = int(time.time())
-        except Exception as error:
-            message = f'Сбой в работе программы: {error}'
-            send_message(bot, message)
-        finally:
-            time.sleep(RETRY_TIME)
+                raise
 
 
 if __name__ == '__main__':
@@ -1,7 +1,6 @@
 import os
 from http import HTTPStatus
 
-import requests
 import telegram
 import utils
 
@@ -18,18 +17,22 @@ class MockResponseGET:
             'Проверьте, что вы делаете запрос на правильный '
             'ресурс API для запроса статуса домашней работы'
         )
-        assert 'headers' in kwargs, (
-            'Проверьте, что вы передали заголовки `headers` для запроса '
-            'статуса домашней работы'
-        )
-        assert 'Authorization' in kwargs['headers'], (
-            'Проверьте, что в параметры `headers` для запроса статуса '
+        import homework
+
+        assert 'Authorization' in homework.SESSION.headers, (
+            'Проверьте, что в заголовки сессии для запроса статуса '
             'домашней работы добавили Authorization'
         )
-        assert kwargs['headers']['Authorization'].startswith('OAuth '), (
-            'Проверьте, что в параметрах `headers` для запроса статуса '
+        assert homework.SESSION.headers['Authorization'].startswith(
+            'OAuth '
+        ), (
+            'Проверьте, что в заголовках сессии для запроса статуса '
             'домашней работы Authorization начинается с OAuth'
         )
+        assert kwargs.get('timeout') is not None, (
+            'Проверьте, что вы передали `timeout` для запроса '
+            'статуса домашней работы'
+        )
         assert params is not None, (
             'Проверьте, что передали параметры `params` для запроса '
             'статуса домашней работы'
@@ -186,7 +189,7 @@ class TestHomework:
                 current_timestamp=current_timestamp, **kwargs
             )
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -232,7 +235,7 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_500_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_500_response_get)
 
         import homework
 
@@ -315,7 +318,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -352,7 +355,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -400,7 +403,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -448,7 +451,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -484,7 +487,7 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_no_homeworks_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_no_homeworks_response_get)
 
         import homework
 
@@ -525,7 +528,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -565,7 +568,7 @@ class TestHomework:
             response.json = valid_response_json
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 
@@ -599,7 +602,7 @@ class TestHomework:
             response.json = json_invalid
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_empty_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_empty_response_get)
 
         import homework
 
@@ -626,7 +629,7 @@ class TestHomework:
             )
             return response
 
-        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr('homework.SESSION.get', mock_response_get)
 
         import homework
 